@@ -1,13 +1,116 @@
 import customtkinter as ctk
 import json
 import random as ra
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Row and column offsets of the 8 cells surrounding a cell
+_NEIGHBOR_OFFSETS = tuple(
+    (dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)
+)
+
+
+def _default_config():
+    """
+    Build the default configuration used when config.json is missing or corrupted.
+
+    Returns:
+        dict: Fresh default configuration data
+    """
+    return {
+        "current_diff": "easy",
+        "current_theme": "dark",
+        "initial_width": 500,
+        "initial_height": 650,
+        "best_time": {"easy": 9999, "normal": 9999, "hard": 9999},
+        "difficulties": {
+            "easy": {"width": 9, "height": 9, "mines": 10},
+            "normal": {"width": 16, "height": 16, "mines": 40},
+            "hard": {"width": 30, "height": 16, "mines": 80},
+            "custom": {"width": 10, "height": 10, "mines": 1},
+        },
+        "themes": {
+            "light": {
+                "main_label": "#0D47A1",
+                "main_color": "#F5F5F5",
+                "hover_color": "#D0E8FF",
+                "accent_color": "#2196F3",
+                "text_color": "#212121",
+                "button_color": "#E0E0E0",
+                "pressed_color": "#B3E5FC",
+                "flag_color": "#FF7043",
+                "mines_color": "#E53935",
+                "start_color_fg": "#64B5F6",
+                "start_color_text": "#FFFFFF",
+                "start_color_hover": "#42A5F5",
+                "settings_color_fg": "#FFD54F",
+                "settings_color_text": "#000000",
+                "settings_color_hover": "#FFCA28",
+                "exit_color_mainmenu": "#EF5350",
+                "exit_color_text": "#FFFFFF",
+                "exit_color_hover": "#D32F2F",
+                "config_buttons_color": "#E1F5FE",
+                "config_buttons_hover": "#B3E5FC",
+                "config_buttons_text": "#000000",
+                "num_colors": {
+                    "1": "#1976D2",
+                    "2": "#388E3C",
+                    "3": "#F57C00",
+                    "4": "#7B1FA2",
+                    "5": "#C2185B",
+                    "6": "#0097A7",
+                    "7": "#5D4037",
+                    "8": "#455A64",
+                },
+            },
+            "dark": {
+                "main_label": "#64B5F6",
+                "main_color": "#1E1E1E",
+                "hover_color": "#2A2A2A",
+                "accent_color": "#64B5F6",
+                "text_color": "#E0E0E0",
+                "button_color": "#2C2C2C",
+                "pressed_color": "#424242",
+                "flag_color": "#FF7043",
+                "mines_color": "#EF5350",
+                "start_color_fg": "#64B5F6",
+                "start_color_text": "#FFFFFF",
+                "start_color_hover": "#42A5F5",
+                "settings_color_fg": "#26A69A",
+                "settings_color_text": "#FFFFFF",
+                "settings_color_hover": "#00796B",
+                "exit_color_mainmenu": "#E53935",
+                "exit_color_text": "#FFFFFF",
+                "exit_color_hover": "#B71C1C",
+                "config_buttons_color": "#37474F",
+                "config_buttons_hover": "#455A64",
+                "config_buttons_text": "#FFFFFF",
+                "num_colors": {
+                    "1": "#64B5F6",
+                    "2": "#81C784",
+                    "3": "#FFB74D",
+                    "4": "#BA68C8",
+                    "5": "#F06292",
+                    "6": "#4DD0E1",
+                    "7": "#BCAAA4",
+                    "8": "#90A4AE",
+                },
+            },
+        },
+    }
 
 
 class Config:
     """Handles configuration loading, saving, and theme management for the Minesweeper game."""
 
+    __slots__ = ("_config_data", "_dirty", "_best_time_fmt_cache", "_theme", "_io_pool")
+
     def __init__(self):
+        self._dirty = False  # Whether in-memory data has unsaved changes
+        self._io_pool = None  # Worker thread for background writes, created on demand
+        self._best_time_fmt_cache = {}  # Formatted best times by (difficulty, time)
         self._config_data = self.load_config()
+        self._refresh_theme()
 
     def load_config(self):
         """
@@ -18,98 +121,108 @@ class Config:
         """
         try:
             with open("config.json", "r") as f:
-                return json.load(f)
+                data = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
             # Create default configuration if file is missing or corrupted
-            default_config = {
-                "current_diff": "easy",
-                "current_theme": "dark",
-                "initial_width": 500,
-                "initial_height": 650,
-                "best_time": {"easy": 9999, "normal": 9999, "hard": 9999},
-                "difficulties": {
-                    "easy": {"width": 9, "height": 9, "mines": 10},
-                    "normal": {"width": 16, "height": 16, "mines": 40},
-                    "hard": {"width": 30, "height": 16, "mines": 80},
-                    "custom": {"width": 10, "height": 10, "mines": 1},
-                },
-                "themes": {
-                    "light": {
-                        "main_label": "#0D47A1",
-                        "main_color": "#F5F5F5",
-                        "hover_color": "#D0E8FF",
-                        "accent_color": "#2196F3",
-                        "text_color": "#212121",
-                        "button_color": "#E0E0E0",
-                        "pressed_color": "#B3E5FC",
-                        "flag_color": "#FF7043",
-                        "mines_color": "#E53935",
-                        "start_color_fg": "#64B5F6",
-                        "start_color_text": "#FFFFFF",
-                        "start_color_hover": "#42A5F5",
-                        "settings_color_fg": "#FFD54F",
-                        "settings_color_text": "#000000",
-                        "settings_color_hover": "#FFCA28",
-                        "exit_color_mainmenu": "#EF5350",
-                        "exit_color_text": "#FFFFFF",
-                        "exit_color_hover": "#D32F2F",
-                        "config_buttons_color": "#E1F5FE",
-                        "config_buttons_hover": "#B3E5FC",
-                        "config_buttons_text": "#000000",
-                        "num_colors": {
-                            "1": "#1976D2",
-                            "2": "#388E3C",
-                            "3": "#F57C00",
-                            "4": "#7B1FA2",
-                            "5": "#C2185B",
-                            "6": "#0097A7",
-                            "7": "#5D4037",
-                            "8": "#455A64",
-                        },
-                    },
-                    "dark": {
-                        "main_label": "#64B5F6",
-                        "main_color": "#1E1E1E",
-                        "hover_color": "#2A2A2A",
-                        "accent_color": "#64B5F6",
-                        "text_color": "#E0E0E0",
-                        "button_color": "#2C2C2C",
-                        "pressed_color": "#424242",
-                        "flag_color": "#FF7043",
-                        "mines_color": "#EF5350",
-                        "start_color_fg": "#64B5F6",
-                        "start_color_text": "#FFFFFF",
-                        "start_color_hover": "#42A5F5",
-                        "settings_color_fg": "#26A69A",
-                        "settings_color_text": "#FFFFFF",
-                        "settings_color_hover": "#00796B",
-                        "exit_color_mainmenu": "#E53935",
-                        "exit_color_text": "#FFFFFF",
-                        "exit_color_hover": "#B71C1C",
-                        "config_buttons_color": "#37474F",
-                        "config_buttons_hover": "#455A64",
-                        "config_buttons_text": "#FFFFFF",
-                        "num_colors": {
-                            "1": "#64B5F6",
-                            "2": "#81C784",
-                            "3": "#FFB74D",
-                            "4": "#BA68C8",
-                            "5": "#F06292",
-                            "6": "#4DD0E1",
-                            "7": "#BCAAA4",
-                            "8": "#90A4AE",
-                        },
-                    },
-                },
-            }
+            data = _default_config()
             # Save default configuration to file
-            with open("config.json", "w") as f:
-                json.dump(default_config, f, indent=2)
-            return default_config
+            self.save_config(data)
+        # JSON keys are strings; key number colors by mine count instead
+        for theme in data["themes"].values():
+            theme["num_colors"] = {int(k): v for k, v in theme["num_colors"].items()}
+        return data
+
+    def save_config(self, data=None, background=False):
+        """
+        Write configuration data to config.json.
+        The loaded configuration is only written when it has unsaved changes.
+
+        Args:
+            data (dict): Configuration to save, defaults to the loaded configuration
+            background (bool): Whether to write the file on a worker thread
+        """
+        loaded = data is None
+        if loaded:
+            if not self._dirty:
+                return
+            data = self._config_data
+            self._dirty = False
+        # Serialize on the calling thread so later edits cannot leak into the write
+        text = json.dumps(data)
+        try:
+            if self._io_pool is None:
+                if not background:
+                    self._write_config(text)
+                    return
+                self._io_pool = ThreadPoolExecutor(max_workers=1)
+            # Once a worker exists, all writes go through it to keep them in order
+            future = self._io_pool.submit(self._write_config, text)
+            if background:
+                # Nobody waits on the result, so handle failed writes here
+                future.add_done_callback(
+                    lambda done: self._report_write_error(done, loaded)
+                )
+            else:
+                future.result()
+        except OSError:
+            # Keep the changes unsaved so the next save retries them
+            if loaded:
+                self._dirty = True
+            raise
+
+    def _report_write_error(self, future, loaded):
+        """
+        Print the error of a failed background configuration write and mark the
+        loaded configuration unsaved again so the next save retries it.
+
+        Args:
+            future: Completed future of the write
+            loaded (bool): Whether the write was of the loaded configuration
+        """
+        error = future.exception()
+        if error is not None:
+            if loaded:
+                self._dirty = True
+            print(f"Error saving configuration: {error}")
+
+    @staticmethod
+    def _write_config(text):
+        """
+        Write serialized configuration to config.json.
+
+        Args:
+            text (str): JSON text to write
+        """
+        with open("config.json", "w") as f:
+            f.write(text)
+
+    def update(self, container, key, value):
+        """
+        Set a configuration value and mark the configuration dirty if it changed.
+
+        Args:
+            container (dict): Configuration dict holding the value
+            key (str): Key of the value to set
+            value: New value
+        """
+        if container.get(key) != value:
+            container[key] = value
+            self._dirty = True
+            if container is self._config_data and key == "current_theme":
+                self._refresh_theme()
 
     def reload_config(self):
         """Reload configuration from file to reflect any external changes."""
+        if self._io_pool is not None:
+            # Wait for pending background writes before reading the file back
+            self._io_pool.submit(lambda: None).result()
         self._config_data = self.load_config()
+        self._dirty = False
+        self._refresh_theme()
+
+    def _refresh_theme(self):
+        """Resolve the color dictionary of the current theme after it changes."""
+        self._theme = self._config_data["themes"][self._config_data["current_theme"]]
 
     def theme(self, key):
         """
@@ -121,7 +234,12 @@ class Config:
         Returns:
             str: Color value for the specified key
         """
-        return self._config_data["themes"][self.current_theme].get(key)
+        return self._theme.get(key)
+
+    @property
+    def theme_dict(self):
+        """Get the complete color dictionary for the current theme."""
+        return self._theme
 
     @property
     def config(self):
@@ -168,13 +286,51 @@ class Config:
         """Get the best time record for current difficulty."""
         return self._config_data["best_time"][self.current_diff]
 
+    @property
+    def best_time_str(self):
+        """Get the best time for current difficulty formatted as MM:SS, or "-" if unset."""
+        diff = self.current_diff
+        best = self._config_data["best_time"].get(diff, 9999)
+        # Keyed on the value itself, so entries stay valid across reloads
+        key = (diff, best)
+        cache = self._best_time_fmt_cache
+        if key not in cache:
+            cache[key] = (
+                f"{best // 60:02d}:{best % 60:02d}"
+                if diff != "custom" and best != 9999
+                else "-"
+            )
+        return cache[key]
+
 
 class GameState:
     """Manages the current state of the Minesweeper game including field, mines, and timing."""
 
+    __slots__ = (
+        "app",
+        "config",
+        "rng",
+        "first_click",
+        "running",
+        "time_elapsed",
+        "def_zone",
+        "field_frame",
+        "buttons",
+        "cells_remaining",
+        "bomb_cords",
+        "bomb",
+        "revealed",
+        "flagged",
+        "neighbor_bombs",
+        "neighbors",
+        "reveal_styles",
+        "mines",
+    )
+
     def __init__(self, parent, config):
         self.app = parent
         self.config = config
+        self.rng = ra.Random()  # Random generator used for mine placement
         self.reset_game()
 
     def reset_game(self):
@@ -182,29 +338,60 @@ class GameState:
         self.first_click = True
         self.running = False
         self.time_elapsed = 0
-        self.def_zone = []  # Safe zone around first click
-        self.field = []  # 2D array of Cell objects
-        self.buttons = []  # 2D array of GUI buttons
-        self.all_cords = []  # Coordinates of all non-mine cells
-        self.danger_cords = []  # Available coordinates for mine placement
+        self.def_zone = set()  # Safe zone around first click
+        self.field_frame = None  # FieldFrame showing the current field
+        self.buttons = []  # GUI buttons indexed by row * width + col
+        self.cells_remaining = 0  # Number of unrevealed non-mine cells
+        self.bomb_cords = []  # Linear coordinates of placed mines
+        # Per-cell state, one byte per cell indexed by row * width + col
+        self.bomb = bytearray()
+        self.revealed = bytearray()
+        self.flagged = bytearray()
+        self.neighbor_bombs = bytearray()
+        self.neighbors = []  # In-bounds neighbor coordinates of each cell
+        self.reveal_styles = []  # Button options for revealed cells by mine count
         self.mines = self.config.bombs
 
     def do_field(self, buttons, field_frame):
         """
-        Initialize the game field with Cell objects.
+        Initialize the per-cell state arrays and neighbor table for a new field.
 
         Args:
-            buttons (list): 2D array of GUI buttons
+            buttons (list): GUI buttons indexed by row * width + col
             field_frame: Parent frame containing the field
         """
-        self.buttons = buttons
-        self.field = [
-            [
-                Cell(self, col, row, self.config, self.app, field_frame)
-                for col in range(self.config.width)
-            ]
-            for row in range(self.config.height)
+        width = self.config.width
+        height = self.config.height
+        size = width * height
+        self.bomb = bytearray(size)
+        self.revealed = bytearray(size)
+        self.flagged = bytearray(size)
+        self.neighbor_bombs = bytearray(size)
+        # Precompute in-bounds neighbors so hot loops need no bounds checks
+        self.neighbors = [
+            tuple(
+                (row + dr) * width + col + dc
+                for dr, dc in _NEIGHBOR_OFFSETS
+                if 0 <= row + dr < height and 0 <= col + dc < width
+            )
+            for row in range(height)
+            for col in range(width)
         ]
+        # Precompute revealed button options for each neighbor mine count
+        theme = self.config.theme_dict
+        pressed_color = theme["pressed_color"]
+        num_colors = theme["num_colors"]
+        text_color = theme["text_color"]
+        self.reveal_styles = [{"fg_color": pressed_color}] + [
+            {
+                "fg_color": pressed_color,
+                "text_color": num_colors.get(count, text_color),
+                "text": count,
+            }
+            for count in range(1, 9)
+        ]
+        self.buttons = buttons
+        self.field_frame = field_frame
 
     def safe_zone(self, row, col):
         """
@@ -214,12 +401,9 @@ class GameState:
             row (int): Row coordinate of first click
             col (int): Column coordinate of first click
         """
-        for dc in [-1, 0, 1]:
-            for dr in [-1, 0, 1]:
-                new_r = row + dr
-                new_c = col + dc
-                if 0 <= new_c < self.config.width and 0 <= new_r < self.config.height:
-                    self.def_zone.append(new_r * self.config.width + new_c)
+        index = row * self.config.width + col
+        self.def_zone.add(index)
+        self.def_zone.update(self.neighbors[index])
 
     def place_bombs(self):
         """
@@ -227,39 +411,137 @@ class GameState:
         Uses linear coordinates for efficient placement.
         """
         bombs = self.config.bombs
-        self.all_cords = [i for i in range(self.config.height * self.config.width)]
-        # Remove safe zone from available mine placement coordinates
-        self.danger_cords = list(set(self.all_cords) - set(self.def_zone))
-        # Randomly select mine positions
-        bomb_coords = ra.sample(self.danger_cords, bombs)
-        self.all_cords = list(set(self.all_cords) - set(bomb_coords))
-        # Convert linear coordinates to 2D coordinates
-        unique_cords = [
-            (cell // self.config.width, cell % self.config.width)
-            for cell in bomb_coords
-        ]
+        size = self.config.height * self.config.width
+        def_zone = self.def_zone
+        # Randomly select mine positions, oversampling by the safe zone size.
+        # The picks are distinct and in random order, so the first ones outside
+        # the safe zone are a uniform choice among the allowed cells.
+        picks = self.rng.sample(range(size), bombs + len(def_zone))
+        bomb_coords = [i for i in picks if i not in def_zone][:bombs]
+        self.bomb_cords = bomb_coords
         # Place mines on the field
-        for r, c in unique_cords:
-            self.field[r][c].bomb = True
+        bomb = self.bomb
+        for cell in bomb_coords:
+            bomb[cell] = 1
+        self.cells_remaining = size - bombs
 
     def calculate_neighbor_bombs(self):
-        """Calculate the number of adjacent mines for each non-mine cell."""
-        for row in range(self.config.height):
-            for col in range(self.config.width):
-                if not self.field[row][col].bomb:
-                    count = 0
-                    # Check all 8 adjacent cells
-                    for dr in [-1, 0, 1]:
-                        for dc in [-1, 0, 1]:
-                            nr, nc = row + dr, col + dc
-                            # Verify coordinates are within bounds and cell contains mine
-                            if (
-                                0 <= nr < self.config.height
-                                and 0 <= nc < self.config.width
-                                and self.field[nr][nc].bomb
-                            ):
-                                count += 1
-                    self.field[row][col].neighbor_bombs = count
+        """
+        Calculate the number of adjacent mines for each non-mine cell.
+        Each mine increments the counters of its neighbors, so the work scales
+        with the number of mines rather than the field size.
+        """
+        counts = self.neighbor_bombs
+        neighbors = self.neighbors
+        for cell in self.bomb_cords:
+            for neighbor in neighbors[cell]:
+                counts[neighbor] += 1
+        # Mine cells do not show a count
+        for cell in self.bomb_cords:
+            counts[cell] = 0
+
+    def reveal(self, row, col):
+        """
+        Reveal a cell and handle game outcomes or propagate reveals.
+
+        Args:
+            row (int): Row coordinate of the cell
+            col (int): Column coordinate of the cell
+        """
+        index = row * self.config.width + col
+        if not self.bomb[index] and not self.revealed[index]:
+            if not self.flagged[index]:
+                self.flood_reveal(row, col)
+
+        elif self.revealed[index]:
+            # Attempt chord action if already revealed
+            self.try_chord(row, col)
+
+        elif self.bomb[index] and not self.flagged[index]:
+            # Trigger loss condition if mine is revealed
+            EndGamePopup(
+                self.app,
+                self.config,
+                self,
+                self.field_frame,
+                win=False,
+            )
+            self.field_frame.info_frame.stop_timer()
+            self.buttons[index].configure(fg_color=self.config.theme("mines_color"))
+
+    def flood_reveal(self, row, col):
+        """
+        Reveal a safe cell and every cell reachable from it through cells without
+        adjacent mines, using a breadth-first queue instead of recursion.
+
+        Args:
+            row (int): Row coordinate of the starting cell
+            col (int): Column coordinate of the starting cell
+        """
+        width = self.config.width
+        buttons = self.buttons
+        revealed = self.revealed
+        flagged = self.flagged
+        neighbors = self.neighbors
+        reveal_styles = self.reveal_styles
+        # Cells are marked revealed when queued so each one is queued only once
+        start = row * width + col
+        revealed[start] = 1
+        queue = deque([start])
+        opened = 0
+        while queue:
+            index = queue.popleft()
+            opened += 1
+            # Update button appearance for the adjacent mine count
+            neighbor_bombs = self.neighbor_bombs[index]
+            buttons[index].configure(**reveal_styles[neighbor_bombs])
+
+            if neighbor_bombs == 0:
+                # Queue adjacent cells if no nearby bombs
+                for neighbor in neighbors[index]:
+                    if not revealed[neighbor] and not flagged[neighbor]:
+                        revealed[neighbor] = 1
+                        queue.append(neighbor)
+
+        # Every queued cell was newly revealed
+        self.cells_remaining -= opened
+        if self.cells_remaining == 0:
+            # Trigger win condition if all non-mine cells are revealed
+            EndGamePopup(self.app, self.config, self, self.field_frame)
+            self.check_best()
+            self.field_frame.info_frame.stop_timer()
+
+    def try_chord(self, row, col):
+        """
+        Attempt a chord action by revealing neighbors if flagged count matches adjacent bombs.
+        Only works on revealed cells with a number.
+
+        Args:
+            row (int): Row coordinate of the cell
+            col (int): Column coordinate of the cell
+        """
+        width = self.config.width
+        index = row * width + col
+        if not self.revealed[index]:
+            return
+        revealed = self.revealed
+        flagged = self.flagged
+
+        # Count flagged neighbors and collect hidden ones in a single pass
+        flagged_count = 0
+        to_reveal = []
+        for neighbor in self.neighbors[index]:
+            if flagged[neighbor]:
+                flagged_count += 1
+            elif not revealed[neighbor]:
+                to_reveal.append(neighbor)
+
+        # Reveal neighbors if flagged count matches adjacent bombs
+        if flagged_count == self.neighbor_bombs[index]:
+            for neighbor in to_reveal:
+                # An earlier flood may already have opened this cell
+                if not revealed[neighbor]:
+                    self.reveal(*divmod(neighbor, width))
 
     def update_timer(self):
         """
@@ -275,17 +557,14 @@ class GameState:
 
     def check_best(self):
         """Check if current time is a new best record and save it if so."""
-        if (
-            self.config.current_diff != "custom"
-            and self.time_elapsed < self.config.best_time
-        ):
+        diff = self.config.current_diff
+        if diff == "custom":
+            return
+        if self.time_elapsed < self.config.config["best_time"][diff]:
             # Update best time in configuration
-            self.config.config["best_time"][
-                self.config.current_diff
-            ] = self.time_elapsed
-            # Save updated configuration to file
-            with open("config.json", "w") as f:
-                json.dump(self.config.config, f, indent=2)
+            self.config.update(self.config.config["best_time"], diff, self.time_elapsed)
+            # Save updated configuration to file without blocking the UI
+            self.config.save_config(background=True)
 
 
 class MinesweeperApp(ctk.CTk):
@@ -318,7 +597,8 @@ class GreetScreen(ctk.CTkFrame):
 
     def __init__(self, parent, config, game_state):
         self.config = config
-        super().__init__(parent, fg_color=self.config.theme("main_color"))
+        t = self.config.theme_dict
+        super().__init__(parent, fg_color=t["main_color"])
         self.game_state = game_state
         self.parent = parent
 
@@ -330,7 +610,7 @@ class GreetScreen(ctk.CTkFrame):
         greet = ctk.CTkLabel(
             self,
             text="MINESWEEPER",
-            text_color=self.config.theme("main_label"),
+            text_color=t["main_label"],
             font=ctk.CTkFont(family="Impact", size=32, weight="bold"),
         )
         greet.grid(row=0, column=5, padx=5, pady=5)
@@ -339,20 +619,15 @@ class GreetScreen(ctk.CTkFrame):
         ctk.CTkLabel(
             self,
             text="Best time:",
-            text_color=self.config.theme("text_color"),
+            text_color=t["text_color"],
             font=ctk.CTkFont(family="Impact", size=20),
         ).grid(row=2, column=5, padx=5, pady=5)
 
         # Format and display best time
         ctk.CTkLabel(
             self,
-            text=(
-                f"{self.config.best_time//60:02d}:{self.config.best_time%60:02d}"
-                if self.config.current_diff != "custom"
-                and self.config.best_time != 9999
-                else "-"
-            ),
-            text_color=self.config.theme("text_color"),
+            text=self.config.best_time_str,
+            text_color=t["text_color"],
             font=ctk.CTkFont(family="Impact", size=20),
         ).grid(row=3, column=5, padx=5, pady=5, sticky="n")
 
@@ -360,9 +635,9 @@ class GreetScreen(ctk.CTkFrame):
         start_btn = ctk.CTkButton(
             self,
             text="Start Game",
-            fg_color=self.config.theme("start_color_fg"),
-            text_color=self.config.theme("start_color_text"),
-            hover_color=self.config.theme("start_color_hover"),
+            fg_color=t["start_color_fg"],
+            text_color=t["start_color_text"],
+            hover_color=t["start_color_hover"],
             command=self.start_game,
         )
         start_btn.grid(row=4, column=3, rowspan=1, columnspan=5, sticky="nsew")
@@ -371,9 +646,9 @@ class GreetScreen(ctk.CTkFrame):
         config_btn = ctk.CTkButton(
             self,
             text="Settings",
-            fg_color=self.config.theme("settings_color_fg"),
-            text_color=self.config.theme("settings_color_text"),
-            hover_color=self.config.theme("settings_color_hover"),
+            fg_color=t["settings_color_fg"],
+            text_color=t["settings_color_text"],
+            hover_color=t["settings_color_hover"],
             command=self.configuration,
         )
         config_btn.grid(row=6, column=3, rowspan=1, columnspan=5, sticky="nsew")
@@ -382,9 +657,9 @@ class GreetScreen(ctk.CTkFrame):
         ctk.CTkButton(
             self,
             text="Exit",
-            fg_color=self.config.theme("exit_color_mainmenu"),
-            text_color=self.config.theme("exit_color_text"),
-            hover_color=self.config.theme("exit_color_hover"),
+            fg_color=t["exit_color_mainmenu"],
+            text_color=t["exit_color_text"],
+            hover_color=t["exit_color_hover"],
             command=self.parent.destroy,
         ).grid(row=8, column=3, rowspan=1, columnspan=5, sticky="nsew")
 
@@ -424,7 +699,6 @@ class GreetScreen(ctk.CTkFrame):
         game_window = ctk.CTkFrame(
             self.parent, fg_color=self.config.theme("main_color")
         )
-        game_window.grid(row=0, column=0, sticky="nsew")
         game_window.grid_columnconfigure(0, weight=1)
         game_window.grid_rowconfigure(0, weight=4)  # Info section (top)
         game_window.grid_rowconfigure(1, weight=6)  # Game field (bottom)
@@ -438,13 +712,17 @@ class GreetScreen(ctk.CTkFrame):
         info_frame.grid(row=0, column=0, rowspan=1, sticky="nsew")
         field_frame.grid(row=1, column=0, padx=10, pady=0, sticky="nsew")
 
+        # Show the game window once its contents have been created
+        game_window.grid(row=0, column=0, sticky="nsew")
+
 
 class ConfigFrame(ctk.CTkFrame):
     """Configuration screen for game settings including difficulty and theme selection."""
 
     def __init__(self, parent, config):
         self.config = config
-        super().__init__(parent, fg_color=self.config.theme("main_color"))
+        t = self.config.theme_dict
+        super().__init__(parent, fg_color=t["main_color"])
         self.parent = parent
 
         # Configure grid layout
@@ -456,9 +734,9 @@ class ConfigFrame(ctk.CTkFrame):
         self.selected_diff = ctk.StringVar(value=self.config.config["current_diff"])
 
         # Difficulty selection section
-        ctk.CTkLabel(
-            self, text="difficulty:", text_color=self.config.theme("text_color")
-        ).grid(row=1, column=0, columnspan=2, sticky="w", padx=10)
+        ctk.CTkLabel(self, text="difficulty:", text_color=t["text_color"]).grid(
+            row=1, column=0, columnspan=2, sticky="w", padx=10
+        )
 
         # Difficulty radio buttons
         ctk.CTkRadioButton(
@@ -466,7 +744,7 @@ class ConfigFrame(ctk.CTkFrame):
             text="easy",
             variable=self.selected_diff,
             value="easy",
-            text_color=self.config.theme("text_color"),
+            text_color=t["text_color"],
         ).grid(row=2, column=0, columnspan=2, sticky="w", padx=20)
 
         ctk.CTkRadioButton(
@@ -474,7 +752,7 @@ class ConfigFrame(ctk.CTkFrame):
             text="normal",
             variable=self.selected_diff,
             value="normal",
-            text_color=self.config.theme("text_color"),
+            text_color=t["text_color"],
         ).grid(row=3, column=0, columnspan=2, sticky="w", padx=20)
 
         ctk.CTkRadioButton(
@@ -482,7 +760,7 @@ class ConfigFrame(ctk.CTkFrame):
             text="hard",
             variable=self.selected_diff,
             value="hard",
-            text_color=self.config.theme("text_color"),
+            text_color=t["text_color"],
         ).grid(row=4, column=0, columnspan=2, sticky="w", padx=20)
 
         ctk.CTkRadioButton(
@@ -490,16 +768,84 @@ class ConfigFrame(ctk.CTkFrame):
             text="custom",
             variable=self.selected_diff,
             value="custom",
-            text_color=self.config.theme("text_color"),
+            text_color=t["text_color"],
         ).grid(row=5, column=0, columnspan=2, sticky="w", padx=20)
 
+        # Custom difficulty settings
+        self.custom_height = ctk.StringVar(
+            value=str(self.config.config["difficulties"]["custom"]["height"])
+        )
+        self.custom_width = ctk.StringVar(
+            value=str(self.config.config["difficulties"]["custom"]["width"])
+        )
+        self.custom_mines = ctk.StringVar(
+            value=str(self.config.config["difficulties"]["custom"]["mines"])
+        )
+
+        # Control buttons
+        apply_btn = ctk.CTkButton(
+            self,
+            text="Apply",
+            fg_color=t["config_buttons_color"],
+            text_color=t["config_buttons_text"],
+            hover_color=t["config_buttons_hover"],
+            width=100,
+            height=40,
+            command=self.apply_settings,
+        )
+        apply_btn.grid(row=18, column=12, padx=5, pady=5, sticky="")
+
+        OK_btn = ctk.CTkButton(
+            self,
+            text="OK",
+            fg_color=t["config_buttons_color"],
+            text_color=t["config_buttons_text"],
+            hover_color=t["config_buttons_hover"],
+            width=100,
+            height=40,
+            command=self.ok_settings,
+        )
+        OK_btn.grid(row=18, column=10, padx=5, pady=5, sticky="")
+
+        exit_btn = ctk.CTkButton(
+            self,
+            text="Exit",
+            fg_color=t["config_buttons_color"],
+            text_color=t["config_buttons_text"],
+            hover_color=t["config_buttons_hover"],
+            width=100,
+            height=40,
+            command=self.exit_config,
+        )
+        exit_btn.grid(row=18, column=8, padx=5, pady=5, sticky="")
+
+        # Build the secondary widgets once the frame has been mapped rather than
+        # here, since the caller grids this frame only after construction
+        self._custom_built = False
+        self.bind("<Map>", self._on_first_map)
+
+    def _on_first_map(self, event):
+        """
+        Schedule the secondary widgets once the frame has been mapped.
+
+        Args:
+            event: Tkinter Map event
+        """
+        if not self._custom_built:
+            self._custom_built = True
+            self.after_idle(self._lazy_build_custom)
+
+    def _lazy_build_custom(self):
+        """Build theme selection and custom difficulty widgets on the first idle pass after mapping."""
+        t = self.config.theme_dict
+
         # Theme selection radio buttons
         ctk.CTkRadioButton(
             self,
             text="dark",
             variable=self.selected_theme,
             value="dark",
-            text_color=self.config.theme("text_color"),
+            text_color=t["text_color"],
         ).grid(row=7, column=0, columnspan=2, sticky="w", padx=20)
 
         ctk.CTkRadioButton(
@@ -507,40 +853,29 @@ class ConfigFrame(ctk.CTkFrame):
             text="light",
             variable=self.selected_theme,
             value="light",
-            text_color=self.config.theme("text_color"),
+            text_color=t["text_color"],
         ).grid(row=7, column=5, columnspan=2, sticky="w", padx=20)
 
-        # Custom difficulty settings
-        self.custom_height = ctk.StringVar(
-            value=str(self.config.config["difficulties"]["custom"]["height"])
-        )
-        self.custom_width = ctk.StringVar(
-            value=str(self.config.config["difficulties"]["custom"]["width"])
-        )
-        self.custom_mines = ctk.StringVar(
-            value=str(self.config.config["difficulties"]["custom"]["mines"])
-        )
-
         # Custom settings section
         ctk.CTkLabel(
             self,
             text="Custom difficulty settings:",
-            text_color=self.config.theme("text_color"),
+            text_color=t["text_color"],
             font=ctk.CTkFont(weight="bold"),
         ).grid(row=1, column=8, columnspan=4, sticky="w", padx=10)
 
         # Custom settings labels and entry fields
-        ctk.CTkLabel(
-            self, text="Height:", text_color=self.config.theme("text_color")
-        ).grid(row=2, column=8, sticky="w", padx=10)
+        ctk.CTkLabel(self, text="Height:", text_color=t["text_color"]).grid(
+            row=2, column=8, sticky="w", padx=10
+        )
 
-        ctk.CTkLabel(
-            self, text="Width:", text_color=self.config.theme("text_color")
-        ).grid(row=3, column=8, sticky="w", padx=10)
+        ctk.CTkLabel(self, text="Width:", text_color=t["text_color"]).grid(
+            row=3, column=8, sticky="w", padx=10
+        )
 
-        ctk.CTkLabel(
-            self, text="Mines:", text_color=self.config.theme("text_color")
-        ).grid(row=4, column=8, sticky="w", padx=10)
+        ctk.CTkLabel(self, text="Mines:", text_color=t["text_color"]).grid(
+            row=4, column=8, sticky="w", padx=10
+        )
 
         # Entry fields for custom settings
         ctk.CTkEntry(
@@ -564,43 +899,6 @@ class ConfigFrame(ctk.CTkFrame):
             placeholder_text="Mines",
         ).grid(row=4, column=10, sticky="ew", padx=5)
 
-        # Control buttons
-        apply_btn = ctk.CTkButton(
-            self,
-            text="Apply",
-            fg_color=self.config.theme("config_buttons_color"),
-            text_color=self.config.theme("config_buttons_text"),
-            hover_color=self.config.theme("config_buttons_hover"),
-            width=100,
-            height=40,
-            command=self.apply_settings,
-        )
-        apply_btn.grid(row=18, column=12, padx=5, pady=5, sticky="")
-
-        OK_btn = ctk.CTkButton(
-            self,
-            text="OK",
-            fg_color=self.config.theme("config_buttons_color"),
-            text_color=self.config.theme("config_buttons_text"),
-            hover_color=self.config.theme("config_buttons_hover"),
-            width=100,
-            height=40,
-            command=self.ok_settings,
-        )
-        OK_btn.grid(row=18, column=10, padx=5, pady=5, sticky="")
-
-        exit_btn = ctk.CTkButton(
-            self,
-            text="Exit",
-            fg_color=self.config.theme("config_buttons_color"),
-            text_color=self.config.theme("config_buttons_text"),
-            hover_color=self.config.theme("config_buttons_hover"),
-            width=100,
-            height=40,
-            command=self.exit_config,
-        )
-        exit_btn.grid(row=18, column=8, padx=5, pady=5, sticky="")
-
     def apply_settings(self):
         """
         Apply current settings to configuration.
@@ -608,8 +906,12 @@ class ConfigFrame(ctk.CTkFrame):
         """
         try:
             # Update basic settings
-            self.config.config["current_diff"] = self.selected_diff.get()
-            self.config.config["current_theme"] = self.selected_theme.get()
+            self.config.update(
+                self.config.config, "current_diff", self.selected_diff.get()
+            )
+            self.config.update(
+                self.config.config, "current_theme", self.selected_theme.get()
+            )
 
             # Validate and update custom difficulty settings
             if self.selected_diff.get() == "custom":
@@ -617,15 +919,17 @@ class ConfigFrame(ctk.CTkFrame):
                 width_str = self.custom_width.get()
                 mines_str = self.custom_mines.get()
 
-                # Check if all inputs are numeric
+                # Check if all inputs are plain digits; int() alone would also
+                # accept signs, whitespace and underscores
                 if not (
-                    height_str.isdigit() and width_str.isdigit() and mines_str.isdigit()
+                    height_str.isdecimal()
+                    and width_str.isdecimal()
+                    and mines_str.isdecimal()
                 ):
                     raise ValueError("Height, Width and Mines must be numeric")
-
-                height = int(height_str.strip())
-                width = int(width_str.strip())
-                mines = int(mines_str.strip())
+                height = int(height_str)
+                width = int(width_str)
+                mines = int(mines_str)
 
                 if height < 4 or width < 4 or height > 100 or width > 100:
                     raise ValueError(
@@ -640,14 +944,13 @@ class ConfigFrame(ctk.CTkFrame):
                     raise ValueError("Too few mines")
 
                 # Update custom difficulty configuration
-                self.config.config["difficulties"]["custom"]["height"] = height
-                self.config.config["difficulties"]["custom"]["width"] = width
-                self.config.config["difficulties"]["custom"]["mines"] = mines
+                custom = self.config.config["difficulties"]["custom"]
+                self.config.update(custom, "height", height)
+                self.config.update(custom, "width", width)
+                self.config.update(custom, "mines", mines)
 
-            # Save configuration to file
-            with open("config.json", "w") as f:
-                json.dump(self.config.config, f, indent=2)
-            self.config.reload_config()
+            # Save configuration to file; the in-memory data is already current
+            self.config.save_config()
 
         except ValueError as e:
             # Show error dialog for validation errors
@@ -696,7 +999,8 @@ class InfoFrame(ctk.CTkFrame):
 
     def __init__(self, parent, config, game_state):
         self.config = config
-        super().__init__(parent, fg_color=self.config.theme("main_color"))
+        t = self.config.theme_dict
+        super().__init__(parent, fg_color=t["main_color"])
         self.game_state = game_state
 
         # Configure grid layout
@@ -707,7 +1011,7 @@ class InfoFrame(ctk.CTkFrame):
         difficulty = ctk.CTkLabel(
             self,
             text=self.config.current_diff,
-            text_color=self.config.theme("text_color"),
+            text_color=t["text_color"],
         )
         difficulty.grid(row=3, column=0, sticky="nsew")
 
@@ -715,20 +1019,23 @@ class InfoFrame(ctk.CTkFrame):
         self.mines_label = ctk.CTkLabel(
             self,
             text=f"Bombs: {self.game_state.mines}",
-            text_color=self.config.theme("text_color"),
+            text_color=t["text_color"],
         )
         self.mines_label.grid(row=3, column=5, padx=0, pady=5, sticky="nsew")
 
         # Display game timer
-        self.timer = ctk.CTkLabel(
-            self, text="00:00", text_color=self.config.theme("text_color")
-        )
+        self.timer = ctk.CTkLabel(self, text="00:00", text_color=t["text_color"])
         self.timer.grid(row=3, column=9, sticky="nsew")
 
     def start_timer(self):
         """Start the game timer if not already running."""
         if not self.game_state.running:
             self.game_state.running = True
+            # Cache bound methods used on every tick
+            self._timer_state_update = self.game_state.update_timer
+            self._timer_configure = self.timer.configure
+            self._timer_after = self.after
+            self._timer_tick = self.update_timer
             self.update_timer()
 
     def stop_timer(self):
@@ -744,15 +1051,14 @@ class InfoFrame(ctk.CTkFrame):
         Update timer display and schedule next update.
         Updates every second while game is running.
         """
-        if self.game_state.running:
-            time = self.game_state.update_timer()
-            if time is not None:
-                # Format time as MM:SS
-                minutes = self.game_state.time_elapsed // 60
-                seconds = self.game_state.time_elapsed % 60
-                self.timer.configure(text=f"{minutes:02d}:{seconds:02}")
-                # Schedule next update in 1 second
-                self.after(1000, self.update_timer)
+        # The game state only advances the time while the game is running
+        time = self._timer_state_update()
+        if time is not None:
+            # Format time as MM:SS
+            minutes, seconds = divmod(time, 60)
+            self._timer_configure(text=f"{minutes:02d}:{seconds:02d}")
+            # Schedule next update in 1 second
+            self._timer_after(1000, self._timer_tick)
 
 
 class FieldFrame(ctk.CTkFrame):
@@ -771,42 +1077,59 @@ class FieldFrame(ctk.CTkFrame):
             game_state: GameState object managing game logic
             root_parent: Root parent (GreetScreen) for navigation
         """
-        super().__init__(parent, fg_color=self.config.theme("main_color"))
+        t = self.config.theme_dict
+        super().__init__(parent, fg_color=t["main_color"])
         self.buttonsize = buttonsize
         self.info_frame = info_frame
         self.game_state = game_state
         self.root_parent = root_parent
         self.cur_dif = self.config.current_diff
 
-        # Initialize 2D array for buttons
-        self.buttons = [
-            [None for _ in range(self.config.width)] for _ in range(self.config.height)
-        ]
+        width = self.config.width
+        height = self.config.height
+
+        # Initialize flat array for buttons, indexed by row * width + col
+        self.buttons = [None] * (width * height)
+        # Cell coordinates of each button, for the shared right-click handler
+        self._button_coords = {}
 
         # Create game field in game state
         self.game_state.do_field(self.buttons, self)
 
+        # Hoist loop-invariant lookups out of the per-cell loop
+        button = ctk.CTkButton
+        size = self.buttonsize
+        button_color = t["button_color"]
+        text_color = t["text_color"]
+        hover_color = t["hover_color"]
+        on_click = self.on_click
+        on_right_click = self.on_right_click
+        button_coords = self._button_coords
+
         # Create and place buttons for each cell
-        for row in range(self.config.height):
-            for col in range(self.config.width):
-                btn = ctk.CTkButton(
+        buttons = self.buttons
+        index = 0
+        for row in range(height):
+            for col in range(width):
+                # Bind left-click to cell reveal
+                btn = button(
                     self,
-                    width=self.buttonsize,
-                    height=self.buttonsize,
+                    width=size,
+                    height=size,
                     corner_radius=0,
                     text="",
-                    fg_color=self.config.theme("button_color"),
-                    text_color=self.config.theme("text_color"),
-                    hover_color=self.config.theme("hover_color"),
+                    fg_color=button_color,
+                    text_color=text_color,
+                    hover_color=hover_color,
+                    command=lambda r=row, c=col: on_click(r, c),
                 )
                 btn.grid(row=row, column=col, padx=0, pady=0)
 
-                # Bind left-click to cell reveal
-                btn.configure(command=lambda r=row, c=col: self.on_click(r, c))
-
                 # Bind right-click to flag placement
-                btn.bind("<Button-3>", lambda event, r=row, c=col: self.set_flag(r, c))
-                self.buttons[row][col] = btn
+                btn.bind("<Button-3>", on_right_click)
+                button_coords[btn] = (row, col)
+                buttons[index] = btn
+                index += 1
 
     def on_click(self, row, col):
         """
@@ -823,19 +1146,19 @@ class FieldFrame(ctk.CTkFrame):
             self.game_state.place_bombs()
             self.game_state.calculate_neighbor_bombs()
             self.info_frame.start_timer()
-            # Auto-reveal cells in safe zone
-            for dc in [-1, 0, 1]:
-                for dr in [-1, 0, 1]:
-                    new_r = row + dr
-                    new_c = col + dc
-                    if (
-                        0 <= new_c < self.config.width
-                        and 0 <= new_r < self.config.height
-                    ):
-                        self.game_state.field[new_r][new_c].reveal()
-        else:
-            # Reveal clicked cell
-            self.game_state.field[row][col].reveal()
+        # Reveal clicked cell; on the first click it has no adjacent mines, so
+        # the flood fill opens the whole safe zone
+        self.game_state.reveal(row, col)
+
+    def on_right_click(self, event):
+        """
+        Dispatch a right-click to set_flag for the cell whose button received it.
+
+        Args:
+            event: Tkinter event from one of the button's inner widgets
+        """
+        # CTkButton binds on its canvas and label, so the button is their master
+        self.set_flag(*self._button_coords[event.widget.master])
 
     def set_flag(self, row, col):
         """
@@ -845,174 +1168,28 @@ class FieldFrame(ctk.CTkFrame):
             row (int): Row coordinate of the cell
             col (int): Column coordinate of the cell
         """
-        if not self.game_state.field[row][col].revealed:
+        index = row * self.config.width + col
+        btn = self.buttons[index]
+        flagged = self.game_state.flagged
+        if not self.game_state.revealed[index]:
             # Toggle flag state
-            self.game_state.field[row][col].flagged = not self.game_state.field[row][
-                col
-            ].flagged
-            if self.game_state.field[row][col].flagged:
+            flagged[index] = not flagged[index]
+            if flagged[index]:
                 # Set flag color and decrease mine count
-                self.buttons[row][col].configure(
-                    fg_color=self.config.theme("flag_color")
-                )
+                btn.configure(fg_color=self.config.theme("flag_color"))
                 self.game_state.mines -= 1
-                # Update mine count label
-                self.info_frame.mines_label.configure(
-                    text=(
-                        f"Bombs: {self.game_state.mines}"
-                        if self.game_state.mines >= 0
-                        else "Are you dumb?"
-                    )
-                )
             else:
                 # Remove flag and restore button color
-                self.buttons[row][col].configure(
-                    fg_color=self.config.theme("button_color")
-                )
+                btn.configure(fg_color=self.config.theme("button_color"))
                 self.game_state.mines += 1
-                # Update mine count label
-                self.info_frame.mines_label.configure(
-                    text=(
-                        f"Bombs: {self.game_state.mines}"
-                        if self.game_state.mines >= 0
-                        else "Are you dumb?"
-                    )
-                )
-
-
-class Cell:
-    """Represents a single cell in the Minesweeper game field."""
-
-    def __init__(
-        self,
-        parent,
-        col,
-        row,
-        config,
-        app,
-        field_frame,
-        bomb=False,
-        revealed=False,
-        flagged=False,
-        neighbor_bombs=0,
-    ):
-        """
-        Initialize a cell with position and state.
-
-        Args:
-            parent: GameState object managing the cell
-            col (int): Column coordinate
-            row (int): Row coordinate
-            config: Configuration object with game settings
-            app: Main application instance
-            field_frame: FieldFrame containing the cell's button
-            bomb (bool): Whether the cell contains a mine
-            revealed (bool): Whether the cell is revealed
-            flagged (bool): Whether the cell is flagged
-            neighbor_bombs (int): Number of adjacent mines
-        """
-        self.field_frame = field_frame
-        self.app = app
-        self.parent = parent
-        self.config = config
-        self.col = col
-        self.row = row
-        self.bomb = bomb
-        self.revealed = revealed
-        self.flagged = flagged
-        self.neighbor_bombs = neighbor_bombs
-
-    def reveal(self):
-        """Reveal the cell and handle game outcomes or propagate reveals."""
-        if not self.bomb and not self.revealed:
-            if not self.flagged:
-                # Mark cell as revealed and remove from unrevealed list
-                self.revealed = True
-                self.parent.all_cords.remove(self.row * self.config.width + self.col)
-
-                # Update button appearance
-                self.parent.buttons[self.row][self.col].configure(
-                    fg_color=self.config.theme("pressed_color")
+            # Update mine count label
+            self.info_frame.mines_label.configure(
+                text=(
+                    f"Bombs: {self.game_state.mines}"
+                    if self.game_state.mines >= 0
+                    else "Are you dumb?"
                 )
-
-                if self.neighbor_bombs >= 1:
-                    # Set number color based on adjacent bombs
-                    num_color = self.config.theme("num_colors").get(
-                        str(self.neighbor_bombs),
-                        self.config.theme("text_color"),
-                    )
-                    self.parent.buttons[self.row][self.col].configure(
-                        text_color=num_color
-                    )
-                    self.parent.buttons[self.row][self.col].configure(
-                        text=self.neighbor_bombs
-                    )
-
-                if not self.parent.all_cords:
-                    # Trigger win condition if all non-mine cells are revealed
-                    EndGamePopup(self.app, self.config, self.parent, self.field_frame)
-                    self.parent.check_best()
-                    self.field_frame.info_frame.stop_timer()
-
-                if self.neighbor_bombs == 0:
-                    # Recursively reveal adjacent cells if no nearby bombs
-                    for dc in [-1, 0, 1]:
-                        for dr in [-1, 0, 1]:
-                            new_r = self.row + dr
-                            new_c = self.col + dc
-                            if (
-                                0 <= new_c < self.config.width
-                                and 0 <= new_r < self.config.height
-                                and not self.parent.field[new_r][new_c].revealed
-                            ):
-                                self.parent.field[new_r][new_c].reveal()
-
-        elif self.revealed:
-            # Attempt chord action if already revealed
-            self.try_chord()
-
-        elif self.bomb and not self.flagged:
-            # Trigger loss condition if mine is revealed
-            EndGamePopup(
-                self.app,
-                self.config,
-                self.parent,
-                self.field_frame,
-                win=False,
             )
-            self.field_frame.info_frame.stop_timer()
-            self.parent.buttons[self.row][self.col].configure(
-                fg_color=self.config.theme("mines_color")
-            )
-
-    def try_chord(self):
-        """
-        Attempt a chord action by revealing neighbors if flagged count matches adjacent bombs.
-        Only works on revealed cells with a number.
-        """
-        if not self.revealed:
-            return
-
-        # Count flagged neighbors
-        flagged_count = 0
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                nr, nc = self.row + dr, self.col + dc
-                if 0 <= nr < self.config.height and 0 <= nc < self.config.width:
-                    if self.parent.field[nr][nc].flagged:
-                        flagged_count += 1
-
-        # Reveal neighbors if flagged count matches adjacent bombs
-        if flagged_count == self.neighbor_bombs:
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    nr, nc = self.row + dr, self.col + dc
-                    if 0 <= nr < self.config.height and 0 <= nc < self.config.width:
-                        if (
-                            not self.parent.field[nr][nc].revealed
-                            and not self.parent.field[nr][nc].flagged
-                        ):
-                            self.parent.field[nr][nc].reveal()
 
 
 class EndGamePopup(ctk.CTkToplevel):
@@ -1105,5 +1282,6 @@ class EndGamePopup(ctk.CTkToplevel):
         self.app.build_ui()
 
 
-app = MinesweeperApp()
-app.mainloop()
+if __name__ == "__main__":
+    app = MinesweeperApp()
+    app.mainloop()